@@ -47,6 +47,7 @@ class FileAnalysis(BaseModel):
     is_logic_file: bool = Field(False, description="File contains only pure logic")
     is_mixed_file: bool = Field(False, description="File contains both UI and logic")
     ui_percentage: float = Field(0.0, ge=0, le=100, description="Percentage of UI code (0-100)")
+    pure_count: int = Field(0, description="Number of pure top-level functions")
 
 
 class ExtractionSuggestion(BaseModel):
@@ -78,6 +78,7 @@ class ASTAnalyzer:
             is_logic_file=is_logic_file,
             is_mixed_file=is_mixed_file,
             ui_percentage=ui_percentage,
+            pure_count=sum(1 for func in functions if func.is_pure),
         )
 
     def _extract_classes(self, tree: ast.Module) -> List[ClassInfo]:
@@ -2,17 +2,23 @@
 Redis caching layer for analysis results and user history
 Provides high-performance caching with TTL support
 """
-import json
+import base64
 import logging
 from typing import Optional, Dict, Any, List
 from datetime import timedelta
 
+import orjson
 import redis.asyncio as aioredis
 from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
 from api.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Export formats cached per job (same set as the download route's format parameter)
+EXPORT_FORMATS = ("json", "csv", "zip")
+BINARY_EXPORT_FORMATS = frozenset({"zip"})
+
 
 class RedisCache:
     """
@@ -21,6 +27,7 @@ class RedisCache:
     Cache Key Patterns:
     - analysis:result:{job_id}     (TTL: 24h)
     - analysis:progress:{job_id}   (TTL: 1min)
+    - analysis:export:{job_id}:{format} (TTL: 1h)
     - user:history:{user_id}       (TTL: 5min)
     - stats:cache_hits             (permanent)
     - stats:cache_misses           (permanent)
@@ -33,6 +40,7 @@ class RedisCache:
         self.TTL_RESULT = int(timedelta(hours=24).total_seconds())
         self.TTL_PROGRESS = int(timedelta(minutes=1).total_seconds())
         self.TTL_HISTORY = int(timedelta(minutes=5).total_seconds())
+        self.TTL_EXPORT = int(timedelta(hours=1).total_seconds())
 
     async def connect(self):
         """Initialize Redis connection pool (falls back to in-memory fakeredis if unavailable)"""
@@ -70,6 +78,24 @@ class RedisCache:
             raise RuntimeError("Redis not connected and fakeredis unavailable.")
         return self._redis
 
+    def pipeline(self, transaction: bool = False) -> Pipeline:
+        """
+        Create a pipeline that sends queued commands in one round-trip
+
+        Usage:
+            async with cache.pipeline() as pipe:
+                pipe.incr("a")
+                pipe.get("b")
+                results = await pipe.execute()
+
+        Args:
+            transaction: Wrap the queued commands in MULTI/EXEC
+
+        Returns:
+            Redis pipeline bound to the current connection pool
+        """
+        return self.redis.pipeline(transaction=transaction)
+
     # ============ Analysis Result Caching ============
 
     async def set_analysis_result(self, job_id: int, result: Dict[str, Any]) -> bool:
@@ -85,7 +111,8 @@ class RedisCache:
         """
         try:
             key = f"analysis:result:{job_id}"
-            value = json.dumps(result, ensure_ascii=False)
+            # orjson emits compact UTF-8 bytes and parses several times faster than json
+            value = orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS)
             await self.redis.setex(key, self.TTL_RESULT, value)
             logger.debug(f"Cached analysis result for job {job_id}")
             return True
@@ -110,7 +137,7 @@ class RedisCache:
             if value:
                 await self._increment_cache_hits()
                 logger.debug(f"Cache HIT for analysis result {job_id}")
-                return json.loads(value)
+                return orjson.loads(value)
             else:
                 await self._increment_cache_misses()
                 logger.debug(f"Cache MISS for analysis result {job_id}")
@@ -139,6 +166,85 @@ class RedisCache:
             logger.error(f"Failed to invalidate analysis result: {e}")
             return False
 
+    # ============ Export Caching ============
+
+    async def set_export(self, job_id: int, format: str, content: bytes) -> bool:
+        """
+        Cache rendered export file (JSON/CSV/ZIP bytes)
+
+        UTF-8 text formats are stored as-is; only binary formats (ZIP) are
+        base64-encoded, since the client decodes responses as UTF-8.
+
+        Args:
+            job_id: Analysis job ID
+            format: Export format
+            content: Rendered file content
+
+        Returns:
+            True if cached successfully
+        """
+        try:
+            key = f"analysis:export:{job_id}:{format}"
+            if format in BINARY_EXPORT_FORMATS:
+                value = base64.b64encode(content).decode("ascii")
+            else:
+                value = content.decode("utf-8")
+            await self.redis.setex(key, self.TTL_EXPORT, value)
+            logger.debug(f"Cached {format} export for job {job_id}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to cache export: {e}")
+            return False
+
+    async def get_export(self, job_id: int, format: str) -> Optional[bytes]:
+        """
+        Get cached export file
+
+        Args:
+            job_id: Analysis job ID
+            format: Export format
+
+        Returns:
+            Rendered file content or None if not found
+        """
+        try:
+            key = f"analysis:export:{job_id}:{format}"
+            value = await self.redis.get(key)
+
+            if value:
+                await self._increment_cache_hits()
+                logger.debug(f"Cache HIT for {format} export {job_id}")
+                if format in BINARY_EXPORT_FORMATS:
+                    return base64.b64decode(value)
+                return value.encode("utf-8")
+            else:
+                await self._increment_cache_misses()
+                logger.debug(f"Cache MISS for {format} export {job_id}")
+                return None
+        except Exception as e:
+            logger.error(f"Failed to get cached export: {e}")
+            await self._increment_cache_misses()
+            return None
+
+    async def invalidate_exports(self, job_id: int) -> bool:
+        """
+        Invalidate all cached export files for a job
+
+        Args:
+            job_id: Analysis job ID
+
+        Returns:
+            True if invalidated successfully
+        """
+        try:
+            # Formats are a fixed set, so delete the keys directly instead of scanning
+            await self.redis.delete(*(f"analysis:export:{job_id}:{fmt}" for fmt in EXPORT_FORMATS))
+            logger.debug(f"Invalidated export cache for job {job_id}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to invalidate exports: {e}")
+            return False
+
     # ============ Progress Tracking ============
 
     async def set_progress(self, job_id: int, progress: int, status: str, message: str = "") -> bool:
@@ -156,11 +262,11 @@ class RedisCache:
         """
         try:
             key = f"analysis:progress:{job_id}"
-            value = json.dumps({
+            value = orjson.dumps({
                 "progress": progress,
                 "status": status,
                 "message": message
-            }, ensure_ascii=False)
+            })
             await self.redis.setex(key, self.TTL_PROGRESS, value)
             return True
         except Exception as e:
@@ -182,7 +288,7 @@ class RedisCache:
             value = await self.redis.get(key)
 
             if value:
-                return json.loads(value)
+                return orjson.loads(value)
             return None
         except Exception as e:
             logger.error(f"Failed to get cached progress: {e}")
@@ -203,7 +309,7 @@ class RedisCache:
         """
         try:
             key = f"user:history:{user_id}"
-            value = json.dumps(history, ensure_ascii=False)
+            value = orjson.dumps(history, option=orjson.OPT_NON_STR_KEYS)
             await self.redis.setex(key, self.TTL_HISTORY, value)
             logger.debug(f"Cached user history for user {user_id}")
             return True
@@ -228,7 +334,7 @@ class RedisCache:
             if value:
                 await self._increment_cache_hits()
                 logger.debug(f"Cache HIT for user history {user_id}")
-                return json.loads(value)
+                return orjson.loads(value)
             else:
                 await self._increment_cache_misses()
                 logger.debug(f"Cache MISS for user history {user_id}")
@@ -281,11 +387,13 @@ class RedisCache:
             Dict with cache hits, misses, and hit rate
         """
         try:
-            hits = await self.redis.get("stats:cache_hits") or "0"
-            misses = await self.redis.get("stats:cache_misses") or "0"
+            async with self.pipeline() as pipe:
+                pipe.get("stats:cache_hits")
+                pipe.get("stats:cache_misses")
+                hits, misses = await pipe.execute()
 
-            hits_int = int(hits)
-            misses_int = int(misses)
+            hits_int = int(hits or 0)
+            misses_int = int(misses or 0)
             total = hits_int + misses_int
 
             hit_rate = (hits_int / total * 100) if total > 0 else 0.0
@@ -24,6 +24,11 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # Exports
+    EXPORT_DIR: str = "backend/storage/exports"
+    EXPORT_ACCEL_REDIRECT: bool = False  # Let nginx serve ZIP exports via X-Accel-Redirect
+    EXPORT_ACCEL_PREFIX: str = "/internal/exports"
+
     # CORS
     CORS_ORIGINS: list[str] = ["http://localhost:5173", "http://localhost:3000"]
 
@@ -3,10 +3,11 @@ WebSocket Connection Manager for real-time analysis updates
 Manages multiple WebSocket connections per analysis job
 """
 import logging
-from typing import Dict, Set, Any, Optional
+from typing import Dict, Set, Any, Optional, Union
 from datetime import datetime
 from fastapi import WebSocket
-import json
+import msgpack
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +21,11 @@ class ConnectionManager:
     - Real-time progress broadcasting
     - Connection lifecycle management
     - Heartbeat/ping-pong
+    - Per-connection frame encoding: JSON text (default) or MessagePack binary
     """
 
+    ENCODINGS = ("json", "msgpack")
+
     def __init__(self):
         # job_id → Set of WebSocket connections
         self.active_connections: Dict[int, Set[WebSocket]] = {}
@@ -29,7 +33,7 @@ class ConnectionManager:
         # WebSocket → metadata (connection time, last ping, etc.)
         self.connection_metadata: Dict[WebSocket, dict] = {}
 
-    async def connect(self, websocket: WebSocket, job_id: int, user_id: int):
+    async def connect(self, websocket: WebSocket, job_id: int, user_id: int, encoding: str = "json"):
         """
         Accept and register a new WebSocket connection
 
@@ -37,6 +41,7 @@ class ConnectionManager:
             websocket: WebSocket connection
             job_id: Analysis job ID
             user_id: User ID (for authorization tracking)
+            encoding: Frame encoding for server messages ("json" or "msgpack")
         """
         await websocket.accept()
 
@@ -50,6 +55,7 @@ class ConnectionManager:
         self.connection_metadata[websocket] = {
             "job_id": job_id,
             "user_id": user_id,
+            "encoding": encoding,
             "connected_at": datetime.utcnow(),
             "last_ping": datetime.utcnow(),
         }
@@ -83,6 +89,40 @@ class ConnectionManager:
 
         logger.info(f"WebSocket disconnected: job_id={job_id}, user_id={user_id}")
 
+    def _encode(self, message: dict, encoding: str) -> Union[str, bytes]:
+        """
+        Encode a message for the given frame encoding
+
+        Args:
+            message: Message dictionary
+            encoding: "json" (text frame) or "msgpack" (binary frame)
+
+        Returns:
+            str for text frames, bytes for binary frames
+        """
+        if encoding == "msgpack":
+            return msgpack.packb(message, use_bin_type=True)
+        return orjson.dumps(message).decode("utf-8")
+
+    async def _send_frame(self, websocket: WebSocket, frame: Union[str, bytes]):
+        """Send an encoded frame"""
+        if isinstance(frame, bytes):
+            await websocket.send_bytes(frame)
+        else:
+            await websocket.send_text(frame)
+
+    async def _send(self, websocket: WebSocket, message: dict):
+        """
+        Send a message using the connection's negotiated encoding
+
+        Args:
+            websocket: WebSocket connection
+            message: Message dictionary to send
+        """
+        metadata = self.connection_metadata.get(websocket, {})
+        frame = self._encode(message, metadata.get("encoding", "json"))
+        await self._send_frame(websocket, frame)
+
     async def broadcast_to_job(self, job_id: int, message: dict):
         """
         Broadcast a message to all connections for a specific job
@@ -101,9 +141,15 @@ class ConnectionManager:
         # Track disconnected clients
         disconnected = []
 
+        # Encode once per encoding, not once per client
+        frames: Dict[str, Union[str, bytes]] = {}
+
         for websocket in connections:
             try:
-                await websocket.send_json(message)
+                encoding = self.connection_metadata.get(websocket, {}).get("encoding", "json")
+                if encoding not in frames:
+                    frames[encoding] = self._encode(message, encoding)
+                await self._send_frame(websocket, frames[encoding])
             except Exception as e:
                 logger.error(f"Failed to send message to WebSocket: {e}")
                 disconnected.append(websocket)
@@ -184,7 +230,7 @@ class ConnectionManager:
             current_progress: Current progress percentage
         """
         try:
-            await websocket.send_json({
+            await self._send(websocket, {
                 "type": "connected",
                 "job_id": job_id,
                 "status": current_status,
@@ -205,7 +251,7 @@ class ConnectionManager:
             websocket: WebSocket connection
         """
         try:
-            await websocket.send_json({
+            await self._send(websocket, {
                 "type": "ping",
                 "timestamp": datetime.utcnow().isoformat()
             })
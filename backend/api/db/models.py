@@ -9,10 +9,14 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     JSON,
     String,
     Text,
+    UniqueConstraint,
+    desc,
+    text,
 )
 from sqlalchemy.orm import relationship
 
@@ -163,6 +167,19 @@ class AnalysisResult(Base):
 class AnalysisSharing(Base):
     """Team sharing for analysis results"""
     __tablename__ = "analysis_sharing"
+    __table_args__ = (
+        # One sharing record per job and team (upsert target)
+        UniqueConstraint("job_id", "team_id", name="analysis_sharing_job_id_team_id_key"),
+        # Team's shared list, split by expiry: permanent shares newest first,
+        # and expiring shares by expiry for the "expires_at > now" range
+        Index(
+            "idx_analysis_sharing_team_permanent",
+            "team_id",
+            desc("created_at"),
+            postgresql_where=text("expires_at IS NULL")
+        ),
+        Index("idx_analysis_sharing_team_expires_at", "team_id", "expires_at", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     job_id = Column(Integer, ForeignKey("analysis_jobs.id"), nullable=False, index=True)
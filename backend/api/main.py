@@ -3,6 +3,7 @@ FastAPI Application Entry Point
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from api.core.config import settings
 from api.core.cache import cache
@@ -16,7 +17,8 @@ app = FastAPI(
     description="Web-based analysis tool with multiple utilities",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
-    openapi_url="/api/openapi.json"
+    openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse  # Serialize JSON responses with orjson
 )
 
 # Configure CORS
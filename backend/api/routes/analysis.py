@@ -22,6 +22,7 @@ from api.schemas.sharing import (
 from analysis import AnalysisEngine
 from analysis.processors.file_processor import FileProcessor
 from analysis.processors.path_processor import PathProcessor
+from api.services.export_service import export_service
 from api.services.sharing_service import sharing_service
 from datetime import datetime
 import json
@@ -92,6 +93,10 @@ async def run_analysis_background(
         }
         await cache.set_analysis_result(job_id, result_dict)
 
+        # Drop any exports rendered from a previous result
+        await cache.invalidate_exports(job_id)
+        export_service.remove_export_files(job_id)
+
         # Send completion notification via WebSocket
         await ws_manager.send_completion(job_id, result.analysis_summary)
 
@@ -402,7 +407,9 @@ async def delete_analysis(
 
     # Invalidate caches
     await cache.invalidate_analysis_result(job_id)
+    await cache.invalidate_exports(job_id)
     await cache.invalidate_user_history(current_user.id)
+    export_service.remove_export_files(job_id)
 
     # Cleanup uploaded files if exists
     if job.parameters and "upload_id" in job.parameters:
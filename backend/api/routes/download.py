@@ -2,15 +2,17 @@
 File download API endpoints for analysis results
 Supports JSON, CSV, and ZIP formats
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import Response, StreamingResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
-from typing import Literal
-from io import BytesIO
+from typing import Literal, Optional
+from functools import lru_cache
+import hashlib
 import logging
 
 from api.core.dependencies import get_current_user, get_db
 from api.core.cache import cache
+from api.core.config import settings
 from api.db.models import User, AnalysisJob, AnalysisResult
 from api.services.export_service import export_service
 from api.services.sharing_service import sharing_service
@@ -19,11 +21,20 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/analysis", tags=["download"])
 
+SAFE_FILENAME_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-")
+
+EXPORT_MEDIA_TYPES = {
+    "json": "application/json; charset=utf-8",
+    "csv": "text/csv; charset=utf-8",
+    "zip": "application/zip",
+}
+
 
 @router.get("/{job_id}/download")
 async def download_analysis_result(
     job_id: int,
     format: Literal["json", "csv", "zip"] = Query("json", description="Export format"),
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -38,6 +49,9 @@ async def download_analysis_result(
     **Authentication**: Required (JWT token)
     **Authorization**: Owner only (or shared with can_download permission in Phase 3.5)
 
+    **Caching**: Responses carry an `ETag`; send it back in `If-None-Match`
+    to get `304 Not Modified` while the analysis is unchanged
+
     **Examples**:
     ```
     GET /api/v1/analysis/123/download?format=json
@@ -45,20 +59,17 @@ async def download_analysis_result(
     GET /api/v1/analysis/123/download?format=zip
     ```
     """
-    # Verify job ownership or shared access
-    job = db.query(AnalysisJob).filter(AnalysisJob.id == job_id).first()
-
-    if not job:
-        raise HTTPException(status_code=404, detail="Analysis job not found")
-
-    # Check access: owner or shared with can_download permission
-    has_access = sharing_service.check_access(
+    # Verify job exists and user is owner or shared with can_download permission
+    job, has_access = sharing_service.get_job_with_access(
         db=db,
         job_id=job_id,
         user=current_user,
         require_download=True
     )
 
+    if not job:
+        raise HTTPException(status_code=404, detail="Analysis job not found")
+
     if not has_access:
         raise HTTPException(
             status_code=403,
@@ -71,6 +82,22 @@ async def download_analysis_result(
             detail=f"Analysis not completed yet (status: {job.status})"
         )
 
+    # Completed analyses don't change, so the client copy is still valid
+    etag = _export_etag(job, format)
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=_cache_headers(etag))
+
+    # ZIP archives can be handed to nginx once written to the export directory
+    offload = format == "zip" and settings.EXPORT_ACCEL_REDIRECT
+    if offload:
+        if export_service.get_export_file_path(job_id, format).exists():
+            return _accel_redirect_response(format, job.job_name, job_id, etag)
+    else:
+        # Serve a previously rendered export if available
+        content = await cache.get_export(job_id, format)
+        if content is not None:
+            return _export_response(content, format, job.job_name, job_id, etag)
+
     # Get result from cache or database
     result_dict = await cache.get_analysis_result(job_id)
 
@@ -97,17 +124,15 @@ async def download_analysis_result(
 
     # Export in requested format
     try:
-        if format == "json":
-            return _export_json(result_dict, job.job_name, job_id)
-
+        if offload:
+            _save_zip(result_dict, job.job_name, job_id)
+            return _accel_redirect_response(format, job.job_name, job_id, etag)
+        elif format == "json":
+            content = _export_json(result_dict)
         elif format == "csv":
-            return _export_csv(result_dict, job.job_name, job_id)
-
-        elif format == "zip":
-            return _export_zip(result_dict, job.job_name, job_id)
-
+            content = _export_csv(result_dict)
         else:
-            raise HTTPException(status_code=400, detail=f"Unsupported format: {format}")
+            content = _export_zip(result_dict, job.job_name, job_id)
 
     except Exception as e:
         logger.error(f"Failed to export analysis result: {e}")
@@ -116,58 +141,117 @@ async def download_analysis_result(
             detail=f"Export failed: {str(e)}"
         )
 
+    # Cache rendered file for repeat downloads
+    await cache.set_export(job_id, format, content)
 
-def _export_json(result_dict: dict, job_name: str, job_id: int) -> Response:
-    """Export as JSON response"""
-    json_content = export_service.export_json(result_dict)
+    return _export_response(content, format, job.job_name, job_id, etag)
 
-    return Response(
-        content=json_content,
-        media_type="application/json",
-        headers={
-            "Content-Disposition": f'attachment; filename="analysis_{job_id}_{_sanitize_filename(job_name)}.json"',
-            "Content-Type": "application/json; charset=utf-8"
-        }
-    )
 
+def _export_json(result_dict: dict) -> bytes:
+    """Render JSON export"""
+    return export_service.export_json(result_dict)
+
+
+def _export_csv(result_dict: dict) -> bytes:
+    """Render CSV export"""
+    return export_service.export_csv(result_dict).encode('utf-8')
+
+
+def _export_zip(result_dict: dict, job_name: str, job_id: int) -> bytes:
+    """Render ZIP export"""
+    project_name = _sanitize_filename(job_name) or f"analysis_{job_id}"
+    return export_service.export_pure_functions_zip(result_dict, project_name)
 
-def _export_csv(result_dict: dict, job_name: str, job_id: int) -> Response:
-    """Export as CSV response"""
-    csv_content = export_service.export_csv(result_dict)
+
+def _save_zip(result_dict: dict, job_name: str, job_id: int):
+    """Write ZIP export to the export directory for nginx to serve"""
+    project_name = _sanitize_filename(job_name) or f"analysis_{job_id}"
+    export_service.save_pure_functions_zip(job_id, result_dict, project_name)
+
+
+def _download_filename(format: str, job_name: str, job_id: int) -> str:
+    """Attachment filename for an export"""
+    if format == "zip":
+        project_name = _sanitize_filename(job_name) or f"analysis_{job_id}"
+        return f"{project_name}_pure_functions.zip"
+
+    return f"analysis_{job_id}_{_sanitize_filename(job_name)}.{format}"
+
+
+def _export_etag(job: AnalysisJob, format: str) -> str:
+    """
+    Strong ETag for an export
+
+    Derived from the job's last update, which is the completion write
+    """
+    version = job.updated_at.isoformat() if job.updated_at else ""
+    digest = hashlib.blake2b(
+        f"{job.id}:{format}:{version}".encode(),
+        digest_size=16
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check If-None-Match header against ETag"""
+    if not if_none_match:
+        return False
+
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def _cache_headers(etag: str) -> dict:
+    """Validator headers shared by 200 and 304 responses"""
+    return {
+        "ETag": etag,
+        "Cache-Control": "private, max-age=3600",
+    }
+
+
+def _export_response(content: bytes, format: str, job_name: str, job_id: int, etag: str) -> Response:
+    """Build download response for rendered export content"""
+    filename = _download_filename(format, job_name, job_id)
 
     return Response(
-        content=csv_content.encode('utf-8'),
-        media_type="text/csv",
+        content=content,
+        media_type=EXPORT_MEDIA_TYPES[format],
         headers={
-            "Content-Disposition": f'attachment; filename="analysis_{job_id}_{_sanitize_filename(job_name)}.csv"',
-            "Content-Type": "text/csv; charset=utf-8"
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Length": str(len(content)),
+            **_cache_headers(etag),
         }
     )
 
 
-def _export_zip(result_dict: dict, job_name: str, job_id: int) -> StreamingResponse:
-    """Export as ZIP response"""
-    project_name = _sanitize_filename(job_name) or f"analysis_{job_id}"
-    zip_bytes = export_service.export_pure_functions_zip(result_dict, project_name)
+def _accel_redirect_response(format: str, job_name: str, job_id: int, etag: str) -> Response:
+    """
+    Build empty response that tells nginx to send the export file itself
 
-    return StreamingResponse(
-        BytesIO(zip_bytes),
-        media_type="application/zip",
+    nginx maps EXPORT_ACCEL_PREFIX to EXPORT_DIR in an internal location
+    """
+    filename = _download_filename(format, job_name, job_id)
+
+    return Response(
+        media_type=EXPORT_MEDIA_TYPES[format],
         headers={
-            "Content-Disposition": f'attachment; filename="{project_name}_pure_functions.zip"',
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Accel-Redirect": f"{settings.EXPORT_ACCEL_PREFIX}/{job_id}.{format}",
+            **_cache_headers(etag),
         }
     )
 
 
+@lru_cache(maxsize=4096)
 def _sanitize_filename(filename: str) -> str:
     """
     Sanitize filename for safe download
 
-    Removes special characters and limits length
+    Removes special characters and limits length. Memoized, since the same
+    job name is sanitized on every download of that job.
     """
     # Remove special characters
-    safe_chars = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-"
-    sanitized = "".join(c if c in safe_chars else "_" for c in filename)
+    sanitized = "".join(c if c in SAFE_FILENAME_CHARS else "_" for c in filename)
 
     # Limit length
     if len(sanitized) > 50:
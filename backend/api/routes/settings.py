@@ -2,6 +2,7 @@
 User settings API routes
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import text, update
 from sqlalchemy.orm import Session
 
 from api.core.dependencies import get_current_user
@@ -12,6 +13,24 @@ from api.schemas.settings import UserSettings, UserSettingsUpdate
 
 router = APIRouter(prefix="/settings", tags=["Settings"])
 
+MAX_RECENT_TOOLS = 10
+
+# New recent_tools value: tool_id first, then up to :keep previous entries
+RECENT_TOOLS_EXPR = text("""(
+    SELECT json_agg(tool ORDER BY position)
+    FROM (
+        SELECT CAST(:tool_id AS text) AS tool, 0 AS position
+        UNION ALL
+        (
+            SELECT value, ordinality
+            FROM json_array_elements_text(user_settings.recent_tools) WITH ORDINALITY
+            WHERE value <> :tool_id
+            ORDER BY ordinality
+            LIMIT :keep
+        )
+    ) AS recent
+)""")
+
 
 @router.get("", response_model=UserSettings)
 async def get_user_settings(
@@ -233,9 +252,18 @@ async def add_recent_tool(
     Returns:
         Updated user settings
     """
-    settings = db.query(UserSettingsModel).filter(
-        UserSettingsModel.user_id == current_user.id
-    ).first()
+    # Move tool to the front and keep the last 10 in a single UPDATE,
+    # so concurrent calls don't overwrite each other's changes
+    stmt = (
+        update(UserSettingsModel)
+        .where(UserSettingsModel.user_id == current_user.id)
+        .values(recent_tools=RECENT_TOOLS_EXPR.bindparams(
+            tool_id=tool_id,
+            keep=MAX_RECENT_TOOLS - 1,
+        ))
+        .returning(UserSettingsModel)
+    )
+    settings = db.execute(stmt).scalar_one_or_none()
 
     if not settings:
         raise HTTPException(
@@ -243,17 +271,8 @@ async def add_recent_tool(
             detail="User settings not found"
         )
 
-    # Remove tool if already in list
-    if tool_id in settings.recent_tools:
-        settings.recent_tools.remove(tool_id)
-
-    # Add to beginning of list
-    settings.recent_tools.insert(0, tool_id)
-
-    # Keep only last 10
-    settings.recent_tools = settings.recent_tools[:10]
-
+    # Build response before commit expires the returned row
+    response = UserSettings.model_validate(settings)
     db.commit()
-    db.refresh(settings)
 
-    return settings
+    return response
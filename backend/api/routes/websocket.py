@@ -3,9 +3,10 @@ WebSocket endpoints for real-time analysis updates
 """
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query, Depends
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Literal, Optional
 import asyncio
 import logging
+import orjson
 
 from api.core.websocket_manager import manager
 from api.core.security import decode_access_token
@@ -17,6 +18,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["websocket"])
 
+# Seconds between server heartbeat pings
+HEARTBEAT_INTERVAL = 30.0
+
 
 async def get_current_user_ws(token: str = Query(...), db: Session = Depends(get_db)) -> Optional[User]:
     """
@@ -39,11 +43,37 @@ async def get_current_user_ws(token: str = Query(...), db: Session = Depends(get
         return None
 
 
+async def _ping_loop(websocket: WebSocket, interval: float = HEARTBEAT_INTERVAL):
+    """
+    Send a heartbeat ping every `interval` seconds until cancelled
+    """
+    while True:
+        await asyncio.sleep(interval)
+        await manager.send_ping(websocket)
+
+
+async def _iter_messages(websocket: WebSocket):
+    """
+    Yield decoded client messages until the client disconnects
+
+    Accepts both text and binary frames and parses them with orjson
+    """
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+
+        payload = message.get("bytes") or message.get("text")
+        if payload:
+            yield orjson.loads(payload)
+
+
 @router.websocket("/ws/analysis/{job_id}")
 async def websocket_analysis_endpoint(
     websocket: WebSocket,
     job_id: int,
     token: str = Query(...),
+    encoding: Literal["json", "msgpack"] = Query("json"),
     db: Session = Depends(get_db)
 ):
     """
@@ -51,6 +81,10 @@ async def websocket_analysis_endpoint(
 
     **Connection URL**: ws://localhost:8000/ws/analysis/{job_id}?token={jwt_token}
 
+    **Encoding**: Server messages are JSON text frames by default.
+    Pass `encoding=msgpack` to receive MessagePack binary frames instead.
+    Client messages may be sent as JSON text or binary frames.
+
     **Message Types**:
     - connected: Initial connection confirmation with current job state
     - progress: Progress update (0-100%)
@@ -83,7 +117,8 @@ async def websocket_analysis_endpoint(
         return
 
     # Accept connection
-    await manager.connect(websocket, job_id, current_user.id)
+    await manager.connect(websocket, job_id, current_user.id, encoding)
+    ping_task: Optional[asyncio.Task] = None
 
     try:
         # Send initial connected message with current job state
@@ -104,31 +139,28 @@ async def websocket_analysis_endpoint(
                 cached_progress.get("message", "")
             )
 
-        # Keep connection alive and handle incoming messages
-        while True:
-            try:
-                # Wait for client messages (with timeout for heartbeat)
-                data = await asyncio.wait_for(
-                    websocket.receive_json(),
-                    timeout=30.0  # 30 second timeout
-                )
+        # Heartbeat runs alongside the receive loop
+        ping_task = asyncio.create_task(_ping_loop(websocket))
 
-                # Handle pong response
-                if data.get("type") == "pong":
-                    logger.debug(f"Received pong from job {job_id}")
-                    continue
+        # Handle incoming messages until the client disconnects
+        async for data in _iter_messages(websocket):
+            # Handle pong response
+            if data.get("type") == "pong":
+                logger.debug(f"Received pong from job {job_id}")
+                continue
 
-                # Handle other client messages (future extension)
-                logger.debug(f"Received message from job {job_id}: {data}")
+            # Handle other client messages (future extension)
+            logger.debug(f"Received message from job {job_id}: {data}")
 
-            except asyncio.TimeoutError:
-                # Send ping to keep connection alive
-                await manager.send_ping(websocket)
+        logger.info(f"WebSocket disconnected normally: job_id={job_id}, user_id={current_user.id}")
 
     except WebSocketDisconnect:
         logger.info(f"WebSocket disconnected normally: job_id={job_id}, user_id={current_user.id}")
-        manager.disconnect(websocket)
 
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
+
+    finally:
+        if ping_task is not None:
+            ping_task.cancel()
         manager.disconnect(websocket)
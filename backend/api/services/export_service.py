@@ -2,16 +2,82 @@
 Export Service for analysis results
 Supports JSON, CSV, and ZIP formats
 """
-import json
-import csv
+import os
 import zipfile
+from contextlib import contextmanager
 from io import StringIO, BytesIO
-from typing import Dict, Any, List
+from itertools import chain
+from typing import Dict, Any, BinaryIO, Iterator, List, Tuple
 from pathlib import Path
 import logging
 
+import orjson
+
+from api.core.config import settings
+
 logger = logging.getLogger(__name__)
 
+# README.md of the pure functions ZIP; sections are filled in by _generate_readme
+README_TEMPLATE = """\
+# Extracted Pure Functions
+
+## Summary
+
+- **Total Pure Functions**: {total_pure_functions}
+- **Source Files**: {source_files}
+- **Web Readiness**: {web_ready:.1f}%
+
+## Extracted Files
+
+{files_section}
+## Usage Recommendations
+
+These pure functions are web-ready and can be directly reused in your FastAPI backend:
+
+1. **Copy to Backend**: Place these files in your backend logic layer
+2. **Import in Routes**: Use these functions in your API endpoints
+3. **Test Independently**: Pure functions are easy to unit test
+4. **No UI Refactoring**: These functions require no modification
+
+## Web Conversion Guide
+
+**Summary**: {guide_summary}
+**Recommended Approach**: {approach}
+**Estimated Complexity**: {complexity}
+
+{recommendations_section}
+---
+
+Generated by Analysis Tool API
+Total LOC: {total_loc}
+UI Files: {ui_count}
+Logic Files: {logic_count}
+Mixed Files: {mixed_count}"""
+
+# Entries up to this size are stored uncompressed; DEFLATE gains little on them
+ZIP_DEFLATE_THRESHOLD = 4096
+
+# Generated files are repetitive, so the fastest zlib level compresses them nearly as well
+ZIP_COMPRESS_LEVEL = 1
+
+# CSV rows per file category:
+# (result key, classification, web ready with pure functions, web ready without)
+CSV_CATEGORIES = (
+    ("ui_files", "UI", "No", "No"),
+    ("logic_files", "Logic", "Yes", "No"),
+    ("mixed_files", "Mixed", "Partial", "No"),
+)
+
+# CSV header line (csv.writer's excel dialect ends rows with CRLF)
+CSV_HEADER = "File Path,Lines of Code,UI Percentage (%),Pure Functions,Classification,Web Ready\r\n"
+
+
+def _quote_csv_field(value: str) -> str:
+    """Quote a CSV field the way csv.writer does with QUOTE_MINIMAL"""
+    if ',' in value or '"' in value or '\n' in value or '\r' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
 
 class ExportService:
     """
@@ -23,7 +89,10 @@ class ExportService:
     - ZIP: Pure functions extracted with README
     """
 
-    def export_json(self, result_data: Dict[str, Any]) -> str:
+    def __init__(self, export_path: str = settings.EXPORT_DIR):
+        self.export_path = Path(export_path)
+
+    def export_json(self, result_data: Dict[str, Any]) -> bytes:
         """
         Export analysis result as pretty-printed JSON
 
@@ -31,17 +100,15 @@ class ExportService:
             result_data: Complete analysis result dictionary
 
         Returns:
-            JSON string with ensure_ascii=False for Korean support
+            UTF-8 encoded JSON (orjson keeps Korean characters unescaped)
         """
         try:
-            json_str = json.dumps(
+            json_bytes = orjson.dumps(
                 result_data,
-                indent=2,
-                ensure_ascii=False,  # Support Korean characters
-                sort_keys=False
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
             )
-            logger.info(f"Exported analysis result as JSON ({len(json_str)} bytes)")
-            return json_str
+            logger.info(f"Exported analysis result as JSON ({len(json_bytes)} bytes)")
+            return json_bytes
         except Exception as e:
             logger.error(f"Failed to export JSON: {e}")
             raise
@@ -59,70 +126,70 @@ class ExportService:
             CSV string with UTF-8 BOM for Excel compatibility
         """
         try:
-            output = StringIO()
-
-            # UTF-8 BOM for Excel
-            output.write('\ufeff')
-
-            writer = csv.writer(output)
-
-            # Header
-            writer.writerow([
-                "File Path",
-                "Lines of Code",
-                "UI Percentage (%)",
-                "Pure Functions",
-                "Classification",
-                "Web Ready"
-            ])
-
-            # Extract file data from result
-            data = result_data.get("result_data", {})
-
-            # UI Files
-            for file in data.get("ui_files", []):
-                writer.writerow([
-                    file.get("path", ""),
-                    file.get("loc", 0),
-                    f"{file.get('ui_percentage', 0):.1f}",
-                    len([f for f in file.get("functions", []) if f.get("is_pure", False)]),
-                    "UI",
-                    "No"
-                ])
-
-            # Logic Files
-            for file in data.get("logic_files", []):
-                pure_count = len([f for f in file.get("functions", []) if f.get("is_pure", False)])
-                writer.writerow([
-                    file.get("path", ""),
-                    file.get("loc", 0),
-                    f"{file.get('ui_percentage', 0):.1f}",
-                    pure_count,
-                    "Logic",
-                    "Yes" if pure_count > 0 else "No"
-                ])
-
-            # Mixed Files
-            for file in data.get("mixed_files", []):
-                pure_count = len([f for f in file.get("functions", []) if f.get("is_pure", False)])
-                writer.writerow([
-                    file.get("path", ""),
-                    file.get("loc", 0),
-                    f"{file.get('ui_percentage', 0):.1f}",
-                    pure_count,
-                    "Mixed",
-                    "Partial" if pure_count > 0 else "No"
-                ])
-
-            csv_str = output.getvalue()
+            csv_str = "".join(self.iter_csv(result_data))
             logger.info(f"Exported analysis result as CSV ({len(csv_str)} bytes)")
             return csv_str
 
         except Exception as e:
             logger.error(f"Failed to export CSV: {e}")
             raise
-        finally:
-            output.close()
+
+    def iter_csv(self, result_data: Dict[str, Any]) -> Iterator[str]:
+        """
+        Generate CSV export one line at a time
+
+        Rows are formatted directly; only the file path can contain
+        characters that need CSV quoting.
+
+        Args:
+            result_data: Complete analysis result dictionary
+
+        Yields:
+            UTF-8 BOM, then the header line, then one line per file
+        """
+        # UTF-8 BOM for Excel
+        yield '\ufeff'
+
+        yield CSV_HEADER
+
+        # Extract file data from result
+        data = result_data.get("result_data", {})
+
+        for key, classification, ready_if_pure, ready_otherwise in CSV_CATEGORIES:
+            for file in data.get(key, ()):
+                pure_count = self._pure_count(file)
+                web_ready = ready_if_pure if pure_count > 0 else ready_otherwise
+                yield (
+                    f"{_quote_csv_field(file.get('path') or '')},"
+                    f"{file.get('loc', 0)},"
+                    f"{self._format_ui_percentage(file)},"
+                    f"{pure_count},{classification},{web_ready}\r\n"
+                )
+
+    @staticmethod
+    def _pure_count(file_data: Dict[str, Any]) -> int:
+        """Number of pure functions in a file, as recorded by the analysis engine"""
+        pure_count = file_data.get("pure_count")
+        if pure_count is None:
+            # Results stored before the engine recorded pure_count
+            pure_count = sum(1 for f in file_data.get("functions", []) if f.get("is_pure", False))
+        return pure_count
+
+    @staticmethod
+    def _partition(file_data: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Collect the pure functions of a file in a single pass
+
+        Returns:
+            Tuple of (pure functions, pure function count)
+        """
+        pure_functions = [f for f in file_data.get("functions", []) if f.get("is_pure", False)]
+        return pure_functions, len(pure_functions)
+
+    @staticmethod
+    def _format_ui_percentage(file_data: Dict[str, Any]) -> str:
+        """UI percentage of a file formatted for the CSV export"""
+        return f"{file_data.get('ui_percentage', 0):.1f}"
 
     def export_pure_functions_zip(
         self,
@@ -143,31 +210,54 @@ class ExportService:
         Returns:
             ZIP file as bytes
         """
+        zip_buffer = BytesIO()
         try:
-            zip_buffer = BytesIO()
+            self.write_pure_functions_zip(zip_buffer, result_data, project_name)
+            # getvalue() hands over the internal buffer without copying it
+            return zip_buffer.getvalue()
+        finally:
+            zip_buffer.close()
+
+    def write_pure_functions_zip(
+        self,
+        fileobj: BinaryIO,
+        result_data: Dict[str, Any],
+        project_name: str = "extracted_functions"
+    ) -> int:
+        """
+        Write pure functions ZIP archive to a binary file object
+
+        Entries are compressed and written as they are generated, so writing
+        to a file never holds the whole archive in memory.
 
-            with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        Args:
+            fileobj: Writable binary file object
+            result_data: Complete analysis result dictionary
+            project_name: Project name for folder structure
+
+        Returns:
+            Number of pure functions extracted
+        """
+        try:
+            with zipfile.ZipFile(fileobj, 'w', zipfile.ZIP_STORED) as zip_file:
                 data = result_data.get("result_data", {})
                 total_pure_functions = 0
                 extracted_files = []
 
                 # Process all files
-                all_files = (
-                    data.get("ui_files", []) +
-                    data.get("logic_files", []) +
-                    data.get("mixed_files", [])
+                all_files = chain(
+                    data.get("ui_files", ()),
+                    data.get("logic_files", ()),
+                    data.get("mixed_files", ())
                 )
 
                 for file_data in all_files:
-                    file_path = file_data.get("path", "unknown.py")
-                    functions = file_data.get("functions", [])
-
-                    # Filter pure functions
-                    pure_functions = [f for f in functions if f.get("is_pure", False)]
-
-                    if not pure_functions:
+                    if not self._pure_count(file_data):
                         continue
 
+                    file_path = file_data.get("path", "unknown.py")
+                    pure_functions, pure_count = self._partition(file_data)
+
                     # Generate extracted file content
                     extracted_content = self._generate_pure_function_file(
                         file_path,
@@ -177,12 +267,12 @@ class ExportService:
 
                     # Add to ZIP
                     zip_path = f"{project_name}/{Path(file_path).stem}_pure.py"
-                    zip_file.writestr(zip_path, extracted_content)
+                    self._write_zip_entry(zip_file, zip_path, extracted_content)
 
-                    total_pure_functions += len(pure_functions)
+                    total_pure_functions += pure_count
                     extracted_files.append({
                         "file": file_path,
-                        "functions": len(pure_functions)
+                        "functions": pure_count
                     })
 
                 # Generate README
@@ -191,48 +281,110 @@ class ExportService:
                     total_pure_functions,
                     extracted_files
                 )
-                zip_file.writestr(f"{project_name}/README.md", readme_content)
+                self._write_zip_entry(zip_file, f"{project_name}/README.md", readme_content)
 
-            zip_bytes = zip_buffer.getvalue()
-            logger.info(f"Exported {total_pure_functions} pure functions as ZIP ({len(zip_bytes)} bytes)")
-            return zip_bytes
+            logger.info(f"Exported {total_pure_functions} pure functions as ZIP ({fileobj.tell()} bytes)")
+            return total_pure_functions
 
         except Exception as e:
             logger.error(f"Failed to export ZIP: {e}")
             raise
-        finally:
-            zip_buffer.close()
+
+    @staticmethod
+    def _write_zip_entry(zip_file: zipfile.ZipFile, zip_path: str, data: bytes):
+        """Add an entry, compressing it only when it is large enough to benefit"""
+        compress_type = zipfile.ZIP_DEFLATED if len(data) > ZIP_DEFLATE_THRESHOLD else zipfile.ZIP_STORED
+        zip_file.writestr(zip_path, data, compress_type=compress_type, compresslevel=ZIP_COMPRESS_LEVEL)
+
+    # ============ Export Files ============
+
+    def get_export_file_path(self, job_id: int, format: str) -> Path:
+        """Path of the rendered export file for a job"""
+        return self.export_path / f"{job_id}.{format}"
+
+    def save_pure_functions_zip(
+        self,
+        job_id: int,
+        result_data: Dict[str, Any],
+        project_name: str = "extracted_functions"
+    ) -> Path:
+        """
+        Write pure functions ZIP straight into the export directory
+
+        Args:
+            job_id: Analysis job ID
+            result_data: Complete analysis result dictionary
+            project_name: Project name for folder structure
+
+        Returns:
+            Path to the written file
+        """
+        with self._open_export_file(job_id, "zip") as export_file:
+            self.write_pure_functions_zip(export_file, result_data, project_name)
+
+        return self.get_export_file_path(job_id, "zip")
+
+    @contextmanager
+    def _open_export_file(self, job_id: int, format: str) -> Iterator[BinaryIO]:
+        """
+        Open an export file for writing
+
+        The file is written to a temporary name and renamed into place, so
+        a concurrent reader never sees a partially written file.
+        """
+        self.export_path.mkdir(parents=True, exist_ok=True)
+        file_path = self.get_export_file_path(job_id, format)
+        temp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.tmp")
+
+        try:
+            with open(temp_path, "wb") as export_file:
+                yield export_file
+            os.replace(temp_path, file_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    def remove_export_files(self, job_id: int):
+        """Remove all rendered export files for a job"""
+        for file_path in self.export_path.glob(f"{job_id}.*"):
+            try:
+                file_path.unlink()
+            except FileNotFoundError:
+                pass
 
     def _generate_pure_function_file(
         self,
         source_file: str,
         pure_functions: List[Dict[str, Any]],
         file_data: Dict[str, Any]
-    ) -> str:
-        """Generate Python file with extracted pure functions"""
-        lines = [
-            '"""',
-            f'Pure functions extracted from: {source_file}',
-            '',
-            'These functions have no UI dependencies and can be reused in web backend.',
-            '"""',
-            '',
-        ]
+    ) -> bytes:
+        """Generate Python file with extracted pure functions (UTF-8 encoded)"""
+        buffer = StringIO()
+        write = buffer.write
+
+        write(
+            '"""\n'
+            f'Pure functions extracted from: {source_file}\n'
+            '\n'
+            'These functions have no UI dependencies and can be reused in web backend.\n'
+            '"""\n'
+            '\n'
+        )
 
         # Add imports if available
         imports = file_data.get("imports", [])
         if imports:
-            lines.append("# Original imports")
+            write("# Original imports\n")
             for imp in imports:
                 module = imp.get("module", "")
                 names = imp.get("names", [])
                 if names and names != ["*"]:
-                    lines.append(f"from {module} import {', '.join(names)}")
+                    write(f"from {module} import {', '.join(names)}\n")
                 elif names == ["*"]:
-                    lines.append(f"from {module} import *")
+                    write(f"from {module} import *\n")
                 else:
-                    lines.append(f"import {module}")
-            lines.append("")
+                    write(f"import {module}\n")
+            write("\n")
 
         # Add each pure function
         for func in pure_functions:
@@ -241,89 +393,80 @@ class ExportService:
             end_line = func.get("end_line", 0)
             dependencies = func.get("dependencies", [])
 
-            lines.append(f"# Function: {func_name}")
-            lines.append(f"# Original location: lines {start_line}-{end_line}")
+            write(f"# Function: {func_name}\n")
+            write(f"# Original location: lines {start_line}-{end_line}\n")
             if dependencies:
-                lines.append(f"# Dependencies: {', '.join(dependencies)}")
-            lines.append(f"# Web-ready: Yes (Pure function)")
-            lines.append("")
+                write(f"# Dependencies: {', '.join(dependencies)}\n")
+            write("# Web-ready: Yes (Pure function)\n\n")
 
             # Note: We don't have the actual function code stored
             # In a real implementation, you'd extract it from the source file
-            lines.append(f"def {func_name}():")
-            lines.append("    # TODO: Copy function implementation from source file")
-            lines.append(f"    # Source: {source_file}:{start_line}-{end_line}")
-            lines.append("    pass")
-            lines.append("")
+            write(
+                f"def {func_name}():\n"
+                "    # TODO: Copy function implementation from source file\n"
+                f"    # Source: {source_file}:{start_line}-{end_line}\n"
+                "    pass\n"
+                "\n"
+            )
 
-        return "\n".join(lines)
+        # Every block ends with a newline; drop the final one
+        return buffer.getvalue()[:-1].encode('utf-8')
 
     def _generate_readme(
         self,
         result_data: Dict[str, Any],
         total_pure_functions: int,
         extracted_files: List[Dict[str, Any]]
-    ) -> str:
-        """Generate README for extracted functions ZIP"""
+    ) -> bytes:
+        """Generate README for extracted functions ZIP (UTF-8 encoded)"""
         data = result_data.get("result_data", {})
         summary = result_data.get("summary", {})
-
-        lines = [
-            "# Extracted Pure Functions",
-            "",
-            "## Summary",
-            "",
-            f"- **Total Pure Functions**: {total_pure_functions}",
-            f"- **Source Files**: {len(extracted_files)}",
-            f"- **Web Readiness**: {summary.get('web_ready_percentage', 0):.1f}%",
-            "",
-            "## Extracted Files",
-            "",
-        ]
-
-        for item in extracted_files:
-            lines.append(f"- `{Path(item['file']).stem}_pure.py`: {item['functions']} functions")
-
-        lines.extend([
-            "",
-            "## Usage Recommendations",
-            "",
-            "These pure functions are web-ready and can be directly reused in your FastAPI backend:",
-            "",
-            "1. **Copy to Backend**: Place these files in your backend logic layer",
-            "2. **Import in Routes**: Use these functions in your API endpoints",
-            "3. **Test Independently**: Pure functions are easy to unit test",
-            "4. **No UI Refactoring**: These functions require no modification",
-            "",
-            "## Web Conversion Guide",
-            "",
-        ])
-
-        # Add conversion guide
         guide = data.get("web_conversion_guide", {})
-        lines.append(f"**Summary**: {guide.get('summary', 'N/A')}")
-        lines.append(f"**Recommended Approach**: {guide.get('recommended_approach', 'N/A')}")
-        lines.append(f"**Estimated Complexity**: {guide.get('estimated_complexity', 'N/A')}")
-        lines.append("")
+
+        total_loc, ui_count, logic_count, mixed_count, web_ready = (
+            summary.get(key, 0) for key in (
+                "total_loc",
+                "ui_files_count",
+                "logic_files_count",
+                "mixed_files_count",
+                "web_ready_percentage",
+            )
+        )
+        guide_summary, approach, complexity = (
+            guide.get(key, "N/A") for key in (
+                "summary",
+                "recommended_approach",
+                "estimated_complexity",
+            )
+        )
+
+        files_section = "".join(
+            f"- `{Path(item['file']).stem}_pure.py`: {item['functions']} functions\n"
+            for item in extracted_files
+        )
 
         recommendations = guide.get("recommendations", [])
+        recommendations_section = ""
         if recommendations:
-            lines.append("**Recommendations**:")
-            for rec in recommendations:
-                lines.append(f"- {rec}")
-
-        lines.extend([
-            "",
-            "---",
-            "",
-            "Generated by Analysis Tool API",
-            f"Total LOC: {summary.get('total_loc', 0)}",
-            f"UI Files: {summary.get('ui_files_count', 0)}",
-            f"Logic Files: {summary.get('logic_files_count', 0)}",
-            f"Mixed Files: {summary.get('mixed_files_count', 0)}",
-        ])
-
-        return "\n".join(lines)
+            recommendations_section = "**Recommendations**:\n" + "".join(
+                f"- {rec}\n" for rec in recommendations
+            )
+
+        readme = README_TEMPLATE.format(
+            total_pure_functions=total_pure_functions,
+            source_files=len(extracted_files),
+            web_ready=web_ready,
+            files_section=files_section,
+            guide_summary=guide_summary,
+            approach=approach,
+            complexity=complexity,
+            recommendations_section=recommendations_section,
+            total_loc=total_loc,
+            ui_count=ui_count,
+            logic_count=logic_count,
+            mixed_count=mixed_count,
+        )
+        return readme.encode('utf-8')
 
 
 # Global export service instance
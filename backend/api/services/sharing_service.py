@@ -3,8 +3,10 @@ Team Sharing Service for Analysis Results
 Manages permissions and access control for shared analyses
 """
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
+from sqlalchemy import and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from api.db.models import (
@@ -74,52 +76,42 @@ class SharingService:
             raise ValueError("Only Team Leads and Admins can share analyses")
 
         # Verify job ownership
-        job = db.query(AnalysisJob).filter(
+        owned = db.query(AnalysisJob.id).filter(
             AnalysisJob.id == job_id,
             AnalysisJob.user_id == user.id
-        ).first()
+        ).scalar()
 
-        if not job:
+        if owned is None:
             raise ValueError("Analysis job not found or you don't have permission to share it")
 
         # Verify team exists
-        team = db.query(Team).filter(Team.id == team_id).first()
-        if not team:
+        if db.query(Team.id).filter(Team.id == team_id).scalar() is None:
             raise ValueError(f"Team {team_id} not found")
 
-        # Check if already shared (update permissions if so)
-        existing = db.query(AnalysisSharing).filter(
-            AnalysisSharing.job_id == job_id,
-            AnalysisSharing.team_id == team_id
-        ).first()
-
-        if existing:
-            # Update existing sharing
-            existing.can_view = can_view
-            existing.can_download = can_download
-            existing.expires_at = expires_at
-            existing.shared_by_user_id = user.id  # Update sharer
-            db.commit()
-            db.refresh(existing)
-
-            logger.info(f"Updated sharing: job_id={job_id}, team_id={team_id}, user_id={user.id}")
-            return existing
-
-        # Create new sharing
-        sharing = AnalysisSharing(
-            job_id=job_id,
-            team_id=team_id,
-            shared_by_user_id=user.id,
-            can_view=can_view,
-            can_download=can_download,
-            expires_at=expires_at
+        # Create sharing, or update permissions if already shared (single upsert)
+        permissions = {
+            "shared_by_user_id": user.id,
+            "can_view": can_view,
+            "can_download": can_download,
+            "expires_at": expires_at,
+        }
+        stmt = (
+            pg_insert(AnalysisSharing)
+            .values(job_id=job_id, team_id=team_id, **permissions)
+            .on_conflict_do_update(
+                index_elements=[AnalysisSharing.job_id, AnalysisSharing.team_id],
+                set_=permissions
+            )
+            .returning(AnalysisSharing)
         )
+        sharing = db.execute(
+            stmt,
+            execution_options={"populate_existing": True}
+        ).scalar_one()
 
-        db.add(sharing)
         db.commit()
-        db.refresh(sharing)
 
-        logger.info(f"Created sharing: job_id={job_id}, team_id={team_id}, user_id={user.id}")
+        logger.info(f"Shared analysis: job_id={job_id}, team_id={team_id}, user_id={user.id}")
         return sharing
 
     def unshare_with_team(
@@ -198,16 +190,35 @@ class SharingService:
         # Query shared analyses
         now = datetime.utcnow()
 
-        sharing_records = (
-            db.query(AnalysisSharing, AnalysisJob, User)
+        # Select only the columns used below instead of three full entities
+        shared = (
+            db.query(
+                AnalysisJob.id,
+                AnalysisJob.job_name,
+                AnalysisJob.status,
+                AnalysisJob.created_at,
+                User.id.label("owner_id"),
+                User.full_name,
+                User.email,
+                AnalysisSharing.can_view,
+                AnalysisSharing.can_download,
+                AnalysisSharing.shared_by_user_id,
+                AnalysisSharing.created_at.label("shared_at"),
+                AnalysisSharing.expires_at,
+            )
             .join(AnalysisJob, AnalysisSharing.job_id == AnalysisJob.id)
             .join(User, AnalysisJob.user_id == User.id)
             .filter(
                 AnalysisSharing.team_id == user.team_id,
-                AnalysisJob.user_id != user.id,  # Exclude own analyses
-                # Check expiration
-                (AnalysisSharing.expires_at.is_(None)) | (AnalysisSharing.expires_at > now)
+                AnalysisJob.user_id != user.id  # Exclude own analyses
             )
+        )
+
+        # Check expiration: permanent and not-yet-expired shares as separate
+        # branches, so each can use its own index instead of an OR filter
+        rows = (
+            shared.filter(AnalysisSharing.expires_at.is_(None))
+            .union_all(shared.filter(AnalysisSharing.expires_at > now))
             .order_by(AnalysisSharing.created_at.desc())
             .limit(limit)
             .offset(offset)
@@ -215,21 +226,21 @@ class SharingService:
         )
 
         results = []
-        for sharing, job, owner in sharing_records:
+        for row in rows:
             results.append({
-                "job_id": job.id,
-                "job_name": job.job_name,
-                "status": job.status.value,
-                "owner_id": owner.id,
-                "owner_name": owner.full_name or owner.email,
+                "job_id": row.id,
+                "job_name": row.job_name,
+                "status": row.status.value,
+                "owner_id": row.owner_id,
+                "owner_name": row.full_name or row.email,
                 "share": {
-                    "can_view": sharing.can_view,
-                    "can_download": sharing.can_download,
-                    "shared_by_id": sharing.shared_by_user_id,
-                    "shared_at": sharing.created_at.isoformat(),
-                    "expires_at": sharing.expires_at.isoformat() if sharing.expires_at else None
+                    "can_view": row.can_view,
+                    "can_download": row.can_download,
+                    "shared_by_id": row.shared_by_user_id,
+                    "shared_at": row.shared_at.isoformat(),
+                    "expires_at": row.expires_at.isoformat() if row.expires_at else None
                 },
-                "created_at": job.created_at.isoformat()
+                "created_at": row.created_at.isoformat()
             })
 
         return results
@@ -253,13 +264,13 @@ class SharingService:
         Returns:
             True if user has access
         """
-        # Check ownership
-        job = db.query(AnalysisJob).filter(AnalysisJob.id == job_id).first()
-        if not job:
+        # Check ownership (owner column only, no ORM object)
+        owner_id = db.query(AnalysisJob.user_id).filter(AnalysisJob.id == job_id).scalar()
+        if owner_id is None:
             return False
 
         # Owner always has access
-        if job.user_id == user.id:
+        if owner_id == user.id:
             return True
 
         # Check team sharing
@@ -267,7 +278,7 @@ class SharingService:
             return False
 
         now = datetime.utcnow()
-        sharing = db.query(AnalysisSharing).filter(
+        sharing = db.query(AnalysisSharing.can_view, AnalysisSharing.can_download).filter(
             AnalysisSharing.job_id == job_id,
             AnalysisSharing.team_id == user.team_id,
             # Check expiration
@@ -283,6 +294,60 @@ class SharingService:
 
         return sharing.can_view
 
+    def get_job_with_access(
+        self,
+        db: Session,
+        job_id: int,
+        user: User,
+        require_download: bool = False
+    ) -> Tuple[Optional[AnalysisJob], bool]:
+        """
+        Load an analysis job together with the user's access to it
+
+        Ownership and the team sharing record are resolved with a single
+        LEFT JOIN instead of separate job and sharing queries.
+
+        Args:
+            db: Database session
+            job_id: Analysis job ID
+            user: User object
+            require_download: If True, check for can_download permission
+
+        Returns:
+            Tuple of (job or None if not found, True if user has access)
+        """
+        now = datetime.utcnow()
+
+        row = (
+            db.query(AnalysisJob, AnalysisSharing.can_view, AnalysisSharing.can_download)
+            .outerjoin(
+                AnalysisSharing,
+                and_(
+                    AnalysisSharing.job_id == AnalysisJob.id,
+                    AnalysisSharing.team_id == user.team_id,
+                    # Check expiration
+                    (AnalysisSharing.expires_at.is_(None)) | (AnalysisSharing.expires_at > now)
+                )
+            )
+            .filter(AnalysisJob.id == job_id)
+            .first()
+        )
+
+        if not row:
+            return None, False
+
+        job, can_view, can_download = row
+
+        # Owner always has access
+        if job.user_id == user.id:
+            return job, True
+
+        # Check specific permission (NULL when not shared with user's team)
+        if require_download:
+            return job, bool(can_download)
+
+        return job, bool(can_view)
+
 
 # Global sharing service instance
 sharing_service = SharingService()
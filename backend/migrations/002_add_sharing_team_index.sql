@@ -0,0 +1,12 @@
+--
+-- Migration: Index shared analyses by team and share date
+-- Created: 2026-10-15
+-- Description: Serves the "shared with my team" list (filter by team_id,
+--              ORDER BY created_at DESC LIMIT/OFFSET) from a single index
+--
+
+CREATE INDEX IF NOT EXISTS idx_analysis_sharing_team_created_at
+    ON analysis_sharing(team_id, created_at DESC);
+
+-- Migration complete
+-- To run: psql -U postgres -d analysisdb -f migrations/002_add_sharing_team_index.sql
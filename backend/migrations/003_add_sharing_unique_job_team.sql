@@ -0,0 +1,13 @@
+--
+-- Migration: Enforce one sharing record per job and team
+-- Created: 2026-10-15
+-- Description: share_with_team upserts with ON CONFLICT (job_id, team_id).
+--              001 already declares UNIQUE(job_id, team_id); this covers
+--              databases whose tables were created from the ORM models.
+--
+
+CREATE UNIQUE INDEX IF NOT EXISTS analysis_sharing_job_id_team_id_key
+    ON analysis_sharing(job_id, team_id);
+
+-- Migration complete
+-- To run: psql -U postgres -d analysisdb -f migrations/003_add_sharing_unique_job_team.sql
@@ -0,0 +1,22 @@
+--
+-- Migration: Split the team sharing index by expiry
+-- Created: 2026-10-15
+-- Description: The "shared with my team" list queries permanent shares
+--              (expires_at IS NULL) and unexpired shares (expires_at > now)
+--              as two UNION ALL branches; give each branch its own index.
+--              NOW() is not immutable, so the active-share filter cannot be
+--              a partial index predicate itself.
+--
+
+CREATE INDEX IF NOT EXISTS idx_analysis_sharing_team_permanent
+    ON analysis_sharing(team_id, created_at DESC)
+    WHERE expires_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_analysis_sharing_team_expires_at
+    ON analysis_sharing(team_id, expires_at, created_at);
+
+-- Superseded by the two indexes above
+DROP INDEX IF EXISTS idx_analysis_sharing_team_created_at;
+
+-- Migration complete
+-- To run: psql -U postgres -d analysisdb -f migrations/004_split_sharing_team_index.sql
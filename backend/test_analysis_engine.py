@@ -3,7 +3,7 @@ Test script for Phase 2 Analysis Engine
 Tests the PyQt analysis engine on sample project
 """
 import asyncio
-import json
+import sys
 from pathlib import Path
 from analysis import AnalysisEngine
 
@@ -27,6 +27,8 @@ async def main():
     print(f"\n[*] Analyzing project: {sample_project}")
     print(f"   Path: {sample_project.absolute()}\n")
 
+    out = []
+
     try:
         # Run analysis
         result = await engine.analyze_project(
@@ -34,123 +36,127 @@ async def main():
             project_name="Sample PyQt Tool"
         )
 
-        # Print results
-        print("\n" + "=" * 60)
-        print("ANALYSIS SUMMARY")
-        print("=" * 60)
+        # Collect report lines and write them out in one go
+        emit = out.append
+        emit("\n" + "=" * 60)
+        emit("ANALYSIS SUMMARY")
+        emit("=" * 60)
 
         summary = result.analysis_summary
-        print(f"Project Name: {result.project_name}")
-        print(f"Total Files: {result.total_files}")
-        print(f"Total Lines of Code: {summary['total_loc']}")
-        print(f"UI Frameworks: {', '.join(summary['ui_frameworks'])}")
-        print(f"\nFile Classification:")
-        print(f"  - UI Files: {summary['ui_files_count']}")
-        print(f"  - Logic Files: {summary['logic_files_count']}")
-        print(f"  - Mixed Files: {summary['mixed_files_count']}")
-        print(f"\nCode Elements:")
-        print(f"  - Classes: {summary['total_classes']}")
-        print(f"  - Functions: {summary['total_functions']}")
-        print(f"\nWeb Readiness: {summary['web_ready_percentage']}%")
+        emit(f"Project Name: {result.project_name}")
+        emit(f"Total Files: {result.total_files}")
+        emit(f"Total Lines of Code: {summary['total_loc']}")
+        emit(f"UI Frameworks: {', '.join(summary['ui_frameworks'])}")
+        emit(f"\nFile Classification:")
+        emit(f"  - UI Files: {summary['ui_files_count']}")
+        emit(f"  - Logic Files: {summary['logic_files_count']}")
+        emit(f"  - Mixed Files: {summary['mixed_files_count']}")
+        emit(f"\nCode Elements:")
+        emit(f"  - Classes: {summary['total_classes']}")
+        emit(f"  - Functions: {summary['total_functions']}")
+        emit(f"\nWeb Readiness: {summary['web_ready_percentage']}%")
 
         # UI Files
         if result.ui_files:
-            print("\n" + "=" * 60)
-            print("UI FILES (Predominantly UI Code)")
-            print("=" * 60)
+            emit("\n" + "=" * 60)
+            emit("UI FILES (Predominantly UI Code)")
+            emit("=" * 60)
             for file in result.ui_files:
-                print(f"\n[FILE] {file.path}")
-                print(f"   LOC: {file.loc}")
-                print(f"   UI %: {file.ui_percentage:.1f}%")
-                print(f"   Classes: {len(file.classes)}")
+                emit(f"\n[FILE] {file.path}")
+                emit(f"   LOC: {file.loc}")
+                emit(f"   UI %: {file.ui_percentage:.1f}%")
+                emit(f"   Classes: {len(file.classes)}")
                 for cls in file.classes:
                     if cls.is_ui_class:
-                        print(f"     - {cls.name} (UI class, {cls.loc} LOC)")
-                print(f"   Functions: {len(file.functions)}")
+                        emit(f"     - {cls.name} (UI class, {cls.loc} LOC)")
+                emit(f"   Functions: {len(file.functions)}")
 
         # Logic Files
         if result.logic_files:
-            print("\n" + "=" * 60)
-            print("LOGIC FILES (Pure Business Logic)")
-            print("=" * 60)
+            emit("\n" + "=" * 60)
+            emit("LOGIC FILES (Pure Business Logic)")
+            emit("=" * 60)
             for file in result.logic_files:
-                print(f"\n[FILE] {file.path}")
-                print(f"   LOC: {file.loc}")
-                print(f"   Functions: {len(file.functions)}")
+                emit(f"\n[FILE] {file.path}")
+                emit(f"   LOC: {file.loc}")
+                emit(f"   Functions: {len(file.functions)}")
                 pure_funcs = [f for f in file.functions if f.is_pure]
-                print(f"   Pure Functions: {len(pure_funcs)}")
+                emit(f"   Pure Functions: {len(pure_funcs)}")
                 for func in pure_funcs:
-                    print(f"     - {func.name}() [{func.start_line}-{func.end_line}]")
+                    emit(f"     - {func.name}() [{func.start_line}-{func.end_line}]")
 
         # Mixed Files
         if result.mixed_files:
-            print("\n" + "=" * 60)
-            print("MIXED FILES (UI + Logic Combined)")
-            print("=" * 60)
+            emit("\n" + "=" * 60)
+            emit("MIXED FILES (UI + Logic Combined)")
+            emit("=" * 60)
             for file in result.mixed_files:
-                print(f"\n[FILE] {file.path}")
-                print(f"   LOC: {file.loc}")
-                print(f"   UI %: {file.ui_percentage:.1f}%")
+                emit(f"\n[FILE] {file.path}")
+                emit(f"   LOC: {file.loc}")
+                emit(f"   UI %: {file.ui_percentage:.1f}%")
                 pure_funcs = [f for f in file.functions if f.is_pure]
                 ui_funcs = [f for f in file.functions if len(f.ui_usage) > 0]
-                print(f"   Pure Functions: {len(pure_funcs)}")
-                print(f"   UI-Dependent Functions: {len(ui_funcs)}")
+                emit(f"   Pure Functions: {len(pure_funcs)}")
+                emit(f"   UI-Dependent Functions: {len(ui_funcs)}")
 
         # Extraction Suggestions
         if result.extraction_suggestions:
-            print("\n" + "=" * 60)
-            print("EXTRACTION SUGGESTIONS")
-            print("=" * 60)
+            emit("\n" + "=" * 60)
+            emit("EXTRACTION SUGGESTIONS")
+            emit("=" * 60)
             for i, sugg in enumerate(result.extraction_suggestions, 1):
-                print(f"\n{i}. {sugg.function}() in {sugg.file}")
-                print(f"   Lines: {sugg.start_line}-{sugg.end_line}")
-                print(f"   Reason: {sugg.reason}")
-                print(f"   Web Ready: {'[YES]' if sugg.web_ready else '[NO]'}")
-                print(f"   Effort: {sugg.estimated_effort}")
+                emit(f"\n{i}. {sugg.function}() in {sugg.file}")
+                emit(f"   Lines: {sugg.start_line}-{sugg.end_line}")
+                emit(f"   Reason: {sugg.reason}")
+                emit(f"   Web Ready: {'[YES]' if sugg.web_ready else '[NO]'}")
+                emit(f"   Effort: {sugg.estimated_effort}")
                 if sugg.dependencies:
-                    print(f"   Dependencies: {', '.join(sugg.dependencies[:3])}")
+                    emit(f"   Dependencies: {', '.join(sugg.dependencies[:3])}")
 
         # Refactoring Suggestions
         if result.refactoring_suggestions:
-            print("\n" + "=" * 60)
-            print("REFACTORING SUGGESTIONS")
-            print("=" * 60)
+            emit("\n" + "=" * 60)
+            emit("REFACTORING SUGGESTIONS")
+            emit("=" * 60)
             for i, sugg in enumerate(result.refactoring_suggestions, 1):
-                print(f"\n{i}. {sugg.file}")
-                print(f"   Issue: {sugg.issue}")
-                print(f"   Suggestion: {sugg.suggestion}")
-                print(f"   Priority: {sugg.priority}")
-                print(f"   Effort: {sugg.estimated_effort}")
+                emit(f"\n{i}. {sugg.file}")
+                emit(f"   Issue: {sugg.issue}")
+                emit(f"   Suggestion: {sugg.suggestion}")
+                emit(f"   Priority: {sugg.priority}")
+                emit(f"   Effort: {sugg.estimated_effort}")
 
         # Web Conversion Guide
-        print("\n" + "=" * 60)
-        print("WEB CONVERSION GUIDE")
-        print("=" * 60)
+        emit("\n" + "=" * 60)
+        emit("WEB CONVERSION GUIDE")
+        emit("=" * 60)
         guide = result.web_conversion_guide
-        print(f"\nSummary: {guide.summary}")
-        print(f"Recommended Approach: {guide.recommended_approach}")
-        print(f"Estimated Complexity: {guide.estimated_complexity}")
-        print(f"\nReusable Modules ({len(guide.reusable_modules)}):")
+        emit(f"\nSummary: {guide.summary}")
+        emit(f"Recommended Approach: {guide.recommended_approach}")
+        emit(f"Estimated Complexity: {guide.estimated_complexity}")
+        emit(f"\nReusable Modules ({len(guide.reusable_modules)}):")
         for module in guide.reusable_modules:
-            print(f"  [OK] {module}")
-        print(f"\nUI Components to Replace ({len(guide.ui_components_to_replace)}):")
+            emit(f"  [OK] {module}")
+        emit(f"\nUI Components to Replace ({len(guide.ui_components_to_replace)}):")
         for component in guide.ui_components_to_replace:
-            print(f"  [->] {component}")
-        print(f"\nRecommendations:")
+            emit(f"  [->] {component}")
+        emit(f"\nRecommendations:")
         for rec in guide.recommendations:
-            print(f"  * {rec}")
+            emit(f"  * {rec}")
 
         # Save to JSON
         output_file = "analysis_result.json"
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(result.model_dump(), f, indent=2, ensure_ascii=False)
-        print(f"\n[SAVED] Full results saved to: {output_file}")
+            f.write(result.model_dump_json(indent=2))
+        emit(f"\n[SAVED] Full results saved to: {output_file}")
 
-        print("\n" + "=" * 60)
-        print("[SUCCESS] ANALYSIS COMPLETED SUCCESSFULLY")
-        print("=" * 60)
+        emit("\n" + "=" * 60)
+        emit("[SUCCESS] ANALYSIS COMPLETED SUCCESSFULLY")
+        emit("=" * 60)
+        sys.stdout.write("\n".join(out) + "\n")
 
     except Exception as e:
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
         print(f"\n[ERROR] Analysis failed: {e}")
         import traceback
         traceback.print_exc()
@@ -2,40 +2,34 @@
 Full API integration test - Phase 4 verification
 Tests: register, login, settings, analysis upload, status, result, download, history
 """
-import urllib.request
-import urllib.error
-import urllib.parse
-import json
 import sys
 import time
 
+import httpx
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 BASE = "http://127.0.0.1:8000/api/v1"
 token = None
 
-def req(method, path, data=None, extra_headers=None):
-    url = BASE + path
+# One client for the whole run: requests reuse a keep-alive connection
+client = httpx.Client(base_url=BASE, timeout=15)
+
+def req(method, path, data=None, extra_headers=None, **kwargs):
     h = {}
-    if data is not None:
-        h["Content-Type"] = "application/json"
     if token:
         h["Authorization"] = f"Bearer {token}"
     if extra_headers:
         h.update(extra_headers)
-    body = json.dumps(data).encode() if data is not None else None
-    r = urllib.request.Request(url, data=body, headers=h, method=method)
+    resp = client.request(method, path, json=data, headers=h, **kwargs)
     try:
-        resp = urllib.request.urlopen(r, timeout=15)
-        raw = resp.read()
-        try:
-            return resp.status, json.loads(raw)
-        except:
-            return resp.status, {"_raw": raw.decode(errors="replace")[:100]}
-    except urllib.error.HTTPError as e:
-        raw = e.read()
-        try:
-            return e.code, json.loads(raw)
-        except:
-            return e.code, {"_raw": raw.decode(errors="replace")[:200]}
+        return resp.status_code, json_loads(resp.content)
+    except ValueError:
+        limit = 100 if resp.is_success else 200
+        return resp.status_code, {"_raw": resp.content.decode(errors="replace")[:limit]}
 
 def check(label, code, body, expected=200):
     ok = code == expected
@@ -89,16 +83,8 @@ code, body = req("GET", "/settings")
 check("GET /settings", code, body)
 
 # PATCH theme uses query param
-theme_req = urllib.request.Request(
-    BASE + "/settings/theme?theme=dark",
-    headers={"Authorization": f"Bearer {token}"},
-    method="PATCH"
-)
-try:
-    resp = urllib.request.urlopen(theme_req, timeout=5)
-    check("PATCH /settings/theme?theme=dark", resp.status, json.loads(resp.read()))
-except urllib.error.HTTPError as e:
-    check("PATCH /settings/theme?theme=dark", e.code, json.loads(e.read()))
+code, body = req("PATCH", "/settings/theme", params={"theme": "dark"})
+check("PATCH /settings/theme?theme=dark", code, body)
 
 # ---- 3. ANALYSIS UPLOAD ----
 print("\n[3] Analysis - File Upload", flush=True)
@@ -129,40 +115,16 @@ class MainWindow(QMainWindow):
         print(format_result(result))
 """
 
-boundary = "----FormBoundary7MA4YWxkTrZu0gW"
-body_parts = [
-    f"--{boundary}",
-    'Content-Disposition: form-data; name="file"; filename="app.py"',
-    "Content-Type: text/x-python",
-    "",
-    py_code.decode("utf-8"),
-    f"--{boundary}--",
-]
-multipart_body = "\r\n".join(body_parts).encode("utf-8")
-
-upload_req = urllib.request.Request(
-    BASE + "/analysis/upload",
-    data=multipart_body,
-    headers={
-        "Authorization": f"Bearer {token}",
-        "Content-Type": f"multipart/form-data; boundary={boundary}",
-    },
-    method="POST"
-)
 job_id = None
-try:
-    resp = urllib.request.urlopen(upload_req, timeout=30)
-    upload_body = json.loads(resp.read())
-    if check("POST /analysis/upload", resp.status, upload_body):
-        job_id = upload_body.get("id") or upload_body.get("job_id")
-        print(f"       job_id={job_id}, status={upload_body.get('status')}", flush=True)
-except urllib.error.HTTPError as e:
-    err_raw = e.read()
-    try:
-        err_body = json.loads(err_raw)
-    except:
-        err_body = {"_raw": err_raw.decode(errors="replace")[:300]}
-    check("POST /analysis/upload", e.code, err_body)
+code, upload_body = req(
+    "POST",
+    "/analysis/upload",
+    files={"file": ("app.py", py_code, "text/x-python")},
+    timeout=30
+)
+if check("POST /analysis/upload", code, upload_body):
+    job_id = upload_body.get("id") or upload_body.get("job_id")
+    print(f"       job_id={job_id}, status={upload_body.get('status')}", flush=True)
 
 # ---- 4. STATUS POLLING ----
 if job_id:
@@ -197,22 +159,21 @@ if job_id:
     # ---- 6. DOWNLOAD ----
     print("\n[6] Download", flush=True)
     for fmt in ["json", "csv"]:
-        dl_req = urllib.request.Request(
-            BASE + f"/analysis/{job_id}/download?format={fmt}",
+        resp = client.get(
+            f"/analysis/{job_id}/download",
+            params={"format": fmt},
             headers={"Authorization": f"Bearer {token}"},
-            method="GET"
+            timeout=10
         )
-        try:
-            resp = urllib.request.urlopen(dl_req, timeout=10)
-            data = resp.read()
-            print(f"  [OK] Download {fmt.upper()} - {len(data)} bytes", flush=True)
-        except urllib.error.HTTPError as e:
+        if resp.is_success:
+            print(f"  [OK] Download {fmt.upper()} - {len(resp.content)} bytes", flush=True)
+        else:
             err_body = {}
             try:
-                err_body = json.loads(e.read())
-            except:
+                err_body = json_loads(resp.content)
+            except ValueError:
                 pass
-            check(f"Download {fmt.upper()}", e.code, err_body)
+            check(f"Download {fmt.upper()}", resp.status_code, err_body)
 
 # ---- 7. HISTORY ----
 print("\n[7] History", flush=True)
@@ -227,3 +188,5 @@ if check("GET /analysis/history", code, body):
 print("\n" + "=" * 55, flush=True)
 print("  Test Complete!", flush=True)
 print("=" * 55, flush=True)
+
+client.close()
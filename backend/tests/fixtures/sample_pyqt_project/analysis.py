@@ -6,40 +6,53 @@ from PyQt5.QtWidgets import QMessageBox, QFileDialog
 from typing import List, Dict, Any
 import os
 
+import numpy as np
+
+from data_processor import extract_numeric_column
+
 
 # Pure functions (no UI dependencies)
 
 def calculate_average(numbers: List[float]) -> float:
     """Calculate average of numbers - Pure function"""
-    if not numbers:
+    arr = np.asarray(numbers, dtype=np.float64)
+    if arr.size == 0:
         return 0.0
-    return sum(numbers) / len(numbers)
+    return float(arr.mean())
 
 
 def find_outliers(numbers: List[float], threshold: float = 2.0) -> List[float]:
     """Find outliers in dataset - Pure function"""
-    if not numbers:
+    arr = np.asarray(numbers, dtype=np.float64)
+    if arr.size == 0:
         return []
 
-    mean = calculate_average(numbers)
-    std_dev = (sum((x - mean) ** 2 for x in numbers) / len(numbers)) ** 0.5
+    mean = arr.mean()
+    std_dev = arr.std()
 
-    outliers = [x for x in numbers if abs(x - mean) > threshold * std_dev]
-    return outliers
+    # Take |x - mean| in place so the mask is built from a single temporary
+    deviation = arr - mean
+    np.abs(deviation, out=deviation)
+    mask = deviation > threshold * std_dev
+    return arr[mask].tolist()
 
 
 def normalize_data(numbers: List[float]) -> List[float]:
     """Normalize data to 0-1 range - Pure function"""
-    if not numbers:
+    arr = np.asarray(numbers, dtype=np.float64)
+    if arr.size == 0:
         return []
 
-    min_val = min(numbers)
-    max_val = max(numbers)
+    min_val = arr.min()
+    max_val = arr.max()
 
     if max_val == min_val:
-        return [0.5] * len(numbers)
+        return [0.5] * arr.size
 
-    return [(x - min_val) / (max_val - min_val) for x in numbers]
+    # Shift into a fresh buffer, then scale it in place by the reciprocal range
+    normalized = arr - min_val
+    normalized *= 1.0 / (max_val - min_val)
+    return normalized.tolist()
 
 
 # Mixed functions (has UI dependencies)
@@ -51,14 +64,7 @@ def analyze_and_show_results(data: List[Dict[str, Any]], parent=None) -> Dict[st
     """
     # Pure calculation
     row_count = len(data)
-    numeric_values = []
-
-    for row in data:
-        value = row.get('value', '0')
-        try:
-            numeric_values.append(float(value))
-        except ValueError:
-            pass
+    numeric_values = extract_numeric_column(data)
 
     avg = calculate_average(numeric_values)
     outliers = find_outliers(numeric_values)
@@ -98,10 +104,10 @@ def export_results(data: Dict[str, Any], parent=None) -> bool:
         return False
 
     # Pure file writing
-    import json
+    import orjson
     try:
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         return True
     except Exception as e:
         if parent:
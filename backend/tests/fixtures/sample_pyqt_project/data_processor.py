@@ -3,7 +3,11 @@ Data Processing Module - Pure Logic
 This file contains business logic with no UI dependencies
 """
 import csv
-from typing import List, Dict, Any
+import os
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
+
+import numpy as np
 
 
 def process_csv_data(file_path: str) -> List[Dict[str, Any]]:
@@ -16,14 +20,35 @@ def process_csv_data(file_path: str) -> List[Dict[str, Any]]:
     Returns:
         List of dictionaries representing rows
     """
-    data = []
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def _to_float(value: Any) -> float:
+    """Parse a cell as float, mapping unparseable values to NaN"""
+    try:
+        return float(value)
+    except ValueError:
+        return np.nan
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            data.append(row)
 
-    return data
+def extract_numeric_column(data: List[Dict[str, Any]], column: str = 'value') -> np.ndarray:
+    """
+    Extract a numeric column as a float64 array
+
+    Args:
+        data: List of data rows
+        column: Column to extract
+
+    Returns:
+        Array of parsed values, without cells that are not numbers
+    """
+    values = np.fromiter(
+        (_to_float(row.get(column, '0')) for row in data),
+        dtype=np.float64,
+        count=len(data),
+    )
+    return values[~np.isnan(values)]
 
 
 def calculate_statistics(data: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -48,16 +73,10 @@ def calculate_statistics(data: List[Dict[str, Any]]) -> Dict[str, Any]:
     column_count = len(data[0].keys()) if data else 0
 
     # Calculate numeric statistics (assumes 'value' column exists)
-    numeric_values = []
-    for row in data:
-        value = row.get('value', '0')
-        try:
-            numeric_values.append(float(value))
-        except ValueError:
-            pass
+    numeric_values = extract_numeric_column(data)
 
-    mean = sum(numeric_values) / len(numeric_values) if numeric_values else 0.0
-    total = sum(numeric_values)
+    total = float(numeric_values.sum())
+    mean = total / numeric_values.size if numeric_values.size else 0.0
 
     return {
         "row_count": row_count,
@@ -111,5 +130,31 @@ def validate_data(data: List[Dict[str, Any]], required_columns: List[str]) -> bo
     if not data:
         return False
 
-    first_row = data[0]
-    return all(col in first_row for col in required_columns)
+    return set(required_columns).issubset(data[0].keys())
+
+
+@lru_cache(maxsize=32)
+def _load_with_statistics(
+    file_path: str, mtime_ns: int, size: int
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Load a CSV file and its statistics; mtime_ns and size only key the cache"""
+    data = process_csv_data(file_path)
+    return data, calculate_statistics(data)
+
+
+def load_csv_with_statistics(file_path: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Load CSV file and calculate its statistics, reusing earlier results
+
+    Results are cached per (path, mtime, size), so re-analyzing an unchanged
+    file is free. The returned rows and statistics are shared between calls
+    and must not be modified.
+
+    Args:
+        file_path: Path to CSV file
+
+    Returns:
+        Tuple of (rows, statistics)
+    """
+    st = os.stat(file_path)
+    return _load_with_statistics(file_path, st.st_mtime_ns, st.st_size)
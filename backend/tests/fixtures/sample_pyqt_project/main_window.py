@@ -7,7 +7,7 @@ from PyQt5.QtWidgets import (
     QLabel, QLineEdit, QMessageBox, QFileDialog
 )
 from PyQt5.QtCore import Qt
-from data_processor import process_csv_data, calculate_statistics
+from data_processor import load_csv_with_statistics
 
 
 class MainWindow(QMainWindow):
@@ -78,11 +78,8 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            # Use pure logic function
-            self.data = process_csv_data(file_path)
-
-            # Calculate statistics
-            stats = calculate_statistics(self.data)
+            # Use pure logic function (cached while the file is unchanged)
+            self.data, stats = load_csv_with_statistics(file_path)
 
             # Display results
             result_text = f"Rows: {stats['row_count']}\\n"
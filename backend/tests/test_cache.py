@@ -73,6 +73,30 @@ async def test_cache_invalidation(redis_cache):
     assert cached_after is None
 
 
+@pytest.mark.asyncio
+async def test_export_caching(redis_cache):
+    """Test rendered export caching and invalidation"""
+    job_id = 321
+    zip_bytes = b"PK\x03\x04\x00\xff binary"
+
+    # Set and get binary content
+    success = await redis_cache.set_export(job_id, "zip", zip_bytes)
+    assert success is True
+    assert await redis_cache.get_export(job_id, "zip") == zip_bytes
+
+    # Other formats are cached separately
+    assert await redis_cache.get_export(job_id, "csv") is None
+
+    # Invalidate all formats for the job
+    await redis_cache.set_export(job_id, "csv", "경로,LOC".encode("utf-8"))
+    assert await redis_cache.redis.get(f"analysis:export:{job_id}:csv") == "경로,LOC"
+    assert await redis_cache.get_export(job_id, "csv") == "경로,LOC".encode("utf-8")
+    success = await redis_cache.invalidate_exports(job_id)
+    assert success is True
+    assert await redis_cache.get_export(job_id, "zip") is None
+    assert await redis_cache.get_export(job_id, "csv") is None
+
+
 @pytest.mark.asyncio
 async def test_progress_tracking(redis_cache):
     """Test progress caching"""
@@ -132,6 +156,24 @@ async def test_cache_stats(redis_cache):
     assert 0 <= stats["hit_rate_percentage"] <= 100
 
 
+@pytest.mark.asyncio
+async def test_cache_pipeline(redis_cache):
+    """Test batching commands in a single pipeline round-trip"""
+    async with redis_cache.pipeline() as pipe:
+        pipe.incr("stats:cache_hits")
+        pipe.incr("stats:cache_hits")
+        pipe.incr("stats:cache_misses")
+        pipe.get("stats:cache_hits")
+        results = await pipe.execute()
+
+    assert len(results) == 4
+    assert int(results[3]) == results[1]
+
+    stats = await redis_cache.get_cache_stats()
+    assert stats["cache_hits"] >= 2
+    assert stats["cache_misses"] >= 1
+
+
 @pytest.mark.asyncio
 async def test_clear_all_cache(redis_cache):
     """Test clearing all cache"""
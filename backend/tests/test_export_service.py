@@ -0,0 +1,96 @@
+"""
+Tests for analysis result export service
+"""
+import csv
+import io
+import zipfile
+
+import orjson
+import pytest
+from api.services.export_service import ExportService
+
+
+@pytest.fixture
+def result_data():
+    """Analysis result with Korean text in paths and the conversion guide"""
+    return {
+        "job_id": 1,
+        "job_name": "분석 작업",
+        "result_data": {
+            "ui_files": [
+                {
+                    "path": "ui/메인_화면.py",
+                    "loc": 120,
+                    "ui_percentage": 92.5,
+                    "functions": [{"name": "show", "is_pure": False}]
+                }
+            ],
+            "logic_files": [
+                {
+                    "path": "logic/데이터, 처리.py",
+                    "loc": 80,
+                    "ui_percentage": 0,
+                    "functions": [
+                        {"name": "평균_계산", "is_pure": True, "start_line": 1, "end_line": 5},
+                        {"name": "save", "is_pure": False}
+                    ],
+                    "imports": [{"module": "statistics", "names": ["mean"]}]
+                }
+            ],
+            "mixed_files": [],
+            "web_conversion_guide": {
+                "summary": "로직 재사용 가능",
+                "recommendations": ["순수 함수를 백엔드로 이동"]
+            }
+        },
+        "summary": {"total_loc": 200, "web_ready_percentage": 40.0}
+    }
+
+
+def test_export_json_round_trip(result_data):
+    """Test JSON export keeps Korean text unescaped and round-trips"""
+    content = ExportService().export_json(result_data)
+
+    assert isinstance(content, bytes)
+    assert "분석 작업".encode("utf-8") in content
+    assert orjson.loads(content) == result_data
+
+
+def test_export_csv(result_data):
+    """Test CSV export rows, quoting and Excel BOM"""
+    content = ExportService().export_csv(result_data)
+
+    assert content.startswith("\ufeff")
+    rows = list(csv.reader(io.StringIO(content[1:])))
+
+    assert rows[0][0] == "File Path"
+    assert rows[1] == ["ui/메인_화면.py", "120", "92.5", "0", "UI", "No"]
+    assert rows[2] == ["logic/데이터, 처리.py", "80", "0.0", "1", "Logic", "Yes"]
+    assert len(rows) == 3
+
+
+def test_export_csv_uses_precomputed_pure_count(result_data):
+    """Test CSV export reads pure_count recorded by the analysis engine"""
+    result_data["result_data"]["mixed_files"].append(
+        {"path": "mixed.py", "loc": 10, "ui_percentage": 50, "functions": [], "pure_count": 3}
+    )
+
+    rows = list(csv.reader(io.StringIO(ExportService().export_csv(result_data)[1:])))
+
+    assert rows[-1] == ["mixed.py", "10", "50.0", "3", "Mixed", "Partial"]
+
+
+def test_export_pure_functions_zip(result_data):
+    """Test ZIP export contains only files with pure functions plus README"""
+    content = ExportService().export_pure_functions_zip(result_data, "project")
+
+    with zipfile.ZipFile(io.BytesIO(content)) as zip_file:
+        assert zip_file.namelist() == ["project/데이터, 처리_pure.py", "project/README.md"]
+
+        extracted = zip_file.read("project/데이터, 처리_pure.py").decode("utf-8")
+        assert "from statistics import mean" in extracted
+        assert "def 평균_계산():" in extracted
+
+        readme = zip_file.read("project/README.md").decode("utf-8")
+        assert "- **Total Pure Functions**: 1" in readme
+        assert "- 순수 함수를 백엔드로 이동" in readme